@@ -8,15 +8,22 @@ import os
 import shutil
 import hashlib
 import json
+import time
+import argparse
 from pathlib import Path
 from PIL import Image
 import subprocess
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # Configuration
 MONOREPO_ROOT = Path("/sessions/serene-youthful-shannon/mnt/yp-monorepo")
 BRAND_ASSETS = MONOREPO_ROOT / "packages" / "brand-assets"
 
+# Image categories optimized in step 2 (in report order)
+IMAGE_CATEGORIES = ["images/hero", "images/team", "images/academy", "images/products", "images/icons", "images/backgrounds"]
+IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg'}
+
 # Asset category mappings
 ASSET_CATEGORIES = {
     "logos/primary": [
@@ -220,6 +227,7 @@ def optimize_image(filepath, quality=85, max_dimension=2000):
             webp_size = os.path.getsize(webp_path)
 
             return {
+                "path": str(filepath),
                 "original_size": original_size,
                 "optimized_size": new_size,
                 "webp_size": webp_size,
@@ -227,7 +235,58 @@ def optimize_image(filepath, quality=85, max_dimension=2000):
                 "webp_path": str(webp_path)
             }
     except Exception as e:
-        return {"error": str(e)}
+        return {"path": str(filepath), "error": str(e)}
+
+def find_images():
+    """Images to optimize, in report order (category, then file name)."""
+    images = []
+    for category in IMAGE_CATEGORIES:
+        category_path = BRAND_ASSETS / category
+        if not category_path.exists():
+            continue
+        images.extend(sorted(f for f in category_path.iterdir() if f.suffix.lower() in IMAGE_EXTENSIONS))
+    return images
+
+def group_by_webp(images):
+    """
+    Images grouped by the WebP they write (hero.png and hero.jpg both write
+    hero.webp). A group is optimized in order by one worker, so two
+    processes never write the same file at once.
+    """
+    groups = {}
+    for img_file in images:
+        groups.setdefault(img_file.with_suffix('.webp'), []).append(img_file)
+    return list(groups.values())
+
+def optimize_group(group):
+    """Worker entry point: optimize a group of images in order."""
+    results = [(img_file, optimize_image(img_file)) for img_file in group]
+    # Only the last image's WebP survives; say so on the others
+    for img_file, result in results[:-1]:
+        if "error" not in result:
+            result["webp_overwritten_by"] = str(group[-1])
+    return results
+
+def optimize_images(images, jobs=1):
+    """
+    Optimize images on `jobs` worker processes, largest first so a big hero
+    image doesn't start last and hold up the run. Yields (path, result) as
+    each one finishes.
+    """
+    groups = sorted(group_by_webp(images), key=lambda group: sum(map(get_file_size, group)), reverse=True)
+    if jobs <= 1:
+        for group in groups:
+            yield from optimize_group(group)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(optimize_group, group): group for group in groups}
+        for future in as_completed(futures):
+            try:
+                yield from future.result()
+            except Exception as e:  # Worker died (e.g. out of memory on a huge image)
+                for img_file in futures[future]:
+                    yield img_file, {"path": str(img_file), "error": str(e) or e.__class__.__name__}
 
 def optimize_video(filepath, target_bitrate="2M"):
     """Create optimized WebM version of video."""
@@ -257,6 +316,12 @@ def optimize_video(filepath, target_bitrate="2M"):
         return {"error": str(e)}
 
 def main():
+    parser = argparse.ArgumentParser(description="Brand Asset Organizer & Optimizer")
+    parser.add_argument("--jobs", "-j", type=int, default=1, metavar="N",
+                        help="Worker processes for image optimization (0 = one per CPU)")
+    args = parser.parse_args()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
     print("=" * 60)
     print("BRAND ASSET ORGANIZER & OPTIMIZER")
     print("=" * 60)
@@ -301,24 +366,42 @@ def main():
     print("STEP 2: Optimizing images...")
     print("-" * 60)
 
-    image_extensions = {'.png', '.jpg', '.jpeg'}
-    for category in ["images/hero", "images/team", "images/academy", "images/products", "images/icons", "images/backgrounds"]:
-        category_path = BRAND_ASSETS / category
-        if not category_path.exists():
-            continue
-
-        print(f"\n📷 Optimizing {category}:")
-        for img_file in category_path.iterdir():
-            if img_file.suffix.lower() in image_extensions:
-                result = optimize_image(img_file)
-                if "error" not in result:
-                    savings_pct = (result["savings"] / result["original_size"] * 100) if result["original_size"] > 0 else 0
-                    print(f"  ✅ {img_file.name}: {format_size(result['original_size'])} → {format_size(result['optimized_size'])} ({savings_pct:.1f}% saved)")
-                    print(f"     WebP: {format_size(result['webp_size'])}")
-                    results["optimizations"].append(result)
-                    results["total_optimized_size"] += result["optimized_size"]
-                else:
-                    print(f"  ⚠️  {img_file.name}: {result['error']}")
+    images = find_images()
+    for group in group_by_webp(images):
+        if len(group) > 1:
+            names = ", ".join(img_file.name for img_file in group)
+            print(f"  ⚠️  {names} share {group[0].with_suffix('.webp').name}: only {group[-1].name}'s WebP is kept")
+    print(f"\n📷 Optimizing {len(images)} images on {jobs} worker(s), largest first:")
+    started = time.perf_counter()
+    optimized = {}
+    input_bytes = 0
+    for img_file, result in optimize_images(images, jobs):
+        label = f"{img_file.parent.name}/{img_file.name}"
+        if "error" not in result:
+            savings_pct = (result["savings"] / result["original_size"] * 100) if result["original_size"] > 0 else 0
+            print(f"  ✅ {label}: {format_size(result['original_size'])} → {format_size(result['optimized_size'])} ({savings_pct:.1f}% saved)")
+            print(f"     WebP: {format_size(result['webp_size'])}")
+            optimized[img_file] = result
+            input_bytes += result["original_size"]
+        else:
+            print(f"  ⚠️  {label}: {result['error']}")
+    elapsed = time.perf_counter() - started
+
+    # Report order doesn't depend on which worker finished first
+    for img_file in images:
+        if img_file in optimized:
+            results["optimizations"].append(optimized[img_file])
+            results["total_optimized_size"] += optimized[img_file]["optimized_size"]
+
+    images_per_sec = len(optimized) / elapsed if elapsed > 0 else 0
+    mb_per_sec = input_bytes / 1024 / 1024 / elapsed if elapsed > 0 else 0
+    results["optimization_throughput"] = {
+        "jobs": jobs,
+        "images": len(optimized),
+        "seconds": round(elapsed, 2),
+        "images_per_second": round(images_per_sec, 2),
+        "mb_per_second": round(mb_per_sec, 2),
+    }
 
     # Step 3: Summary
     print("\n" + "=" * 60)
@@ -327,7 +410,8 @@ def main():
     print(f"✅ Assets copied: {len(results['copied'])}")
     print(f"⏭️  Duplicates skipped: {len(results['skipped_duplicates'])}")
     print(f"❌ Not found: {len(results['not_found'])}")
-    print(f"📷 Images optimized: {len(results['optimizations'])}")
+    print(f"📷 Images optimized: {len(results['optimizations'])} in {elapsed:.1f}s "
+          f"({images_per_sec:.1f} images/s, {mb_per_sec:.1f} MB/s on {jobs} worker(s))")
 
     total_savings = results["total_original_size"] - results["total_optimized_size"]
     if results["total_original_size"] > 0:
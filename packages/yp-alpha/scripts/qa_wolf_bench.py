@@ -0,0 +1,490 @@
+#!/usr/bin/env python3
+"""
+Release Wolf - Benchmarks
+=========================
+Times qa_wolf's scanners and auditors against a generated monorepo and a
+local stub HTTP server, so a performance change can be proven with numbers.
+
+Usage:
+    python qa_wolf_bench.py                          # 10k files, 5 runs each, JSON on stdout
+    python qa_wolf_bench.py --files 200000 --repeat 3
+    python qa_wolf_bench.py --latency-ms 50 --broken 20
+    python qa_wolf_bench.py --output bench.json      # Save results...
+    python qa_wolf_bench.py --compare bench.json     # ...and compare a later commit against them
+
+The synthetic tree is kept in --workdir (default: a temp dir) and reused
+while its generation parameters don't change.
+"""
+
+import argparse
+import contextlib
+import gzip
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import qa_wolf  # noqa: E402
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Configuration
+# ═══════════════════════════════════════════════════════════════════════════════
+
+BENCH_VERSION = 1
+BENCH_APPS = 8
+BENCH_PACKAGES = 4
+# Directories per app/package the generated files are spread over
+BENCH_FEATURES = 64
+# Internal links per generated Header (plus the broken ones)
+BENCH_HEADER_LINKS = 30
+BENCH_MANIFEST = ".bench.json"
+# Change of the median (new vs old) that --compare calls out
+BENCH_COMPARE_NOTE = 0.10
+
+# A planted secret: one DANGEROUS_PATTERNS hit per line
+PLANTED_SECRET = "const leakedKey = process.env.OPENAI_API_KEY;\n"
+
+COMPONENT_TEMPLATE = """import {{ useState, useEffect }} from "react";
+import {{ formatPrice, clamp }} from "../../lib/utils{n}";
+
+interface Props{n} {{
+  title: string;
+  count?: number;
+}}
+
+export function Component{n}({{ title, count = {n} }}: Props{n}) {{
+  const [value, setValue] = useState(count);
+  useEffect(() => {{
+    const id = setInterval(() => setValue((v) => clamp(v + 1, 0, {limit})), 1000);
+    return () => clearInterval(id);
+  }}, []);
+  return (
+    <section className="flex flex-col gap-4 p-6 rounded-xl bg-neutral-900">
+      <h2 className="text-xl font-semibold">{{title}}</h2>
+      <p className="text-sm text-neutral-400">Item {n}: {{formatPrice(value)}}</p>
+      <button onClick={{() => setValue(0)}} className="px-4 py-2">Reset</button>
+    </section>
+  );
+}}
+"""
+
+LIB_TEMPLATE = """// Generated helper module {n}
+export const LIMIT_{n} = {limit};
+
+export function formatPrice(cents: number): string {{
+  return `$${{(cents / 100).toFixed(2)}}`;
+}}
+
+export function clamp(value: number, min: number, max: number): number {{
+  return Math.min(Math.max(value, min), max);
+}}
+
+export async function fetchItem{n}(id: string) {{
+  const response = await fetch(`/api/items/${{id}}?v={n}`);
+  if (!response.ok) throw new Error("Request failed: " + response.status);
+  return response.json();
+}}
+"""
+
+PAGE_TEMPLATE = """import {{ Component{n} }} from "@/components/feature-{feature}/Component{n}";
+
+export default function Page{n}() {{
+  return <main className="container mx-auto"><Component{n} title="Page {n}" /></main>;
+}}
+"""
+
+STUB_PAGE = (
+    b"<!DOCTYPE html><html lang=\"en\"><head><title>Stub</title></head><body>"
+    + b"<section><h1>Benchmark page</h1><p>Lorem ipsum dolor sit amet.</p></section>" * 200
+    + b"<a href=\"/shop\">Shop Now</a></body></html>"
+)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Synthetic Monorepo
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def write_file(path: Path, content: str):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding='utf-8')
+
+
+def generated_bundle(size: int, seed: int) -> bytes:
+    """Minified-looking JS of about `size` bytes (one long line, like real chunks)."""
+    rng = random.Random(seed)
+    pieces = []
+    total = 0
+    while total < size:
+        n = rng.randrange(1 << 30)
+        piece = (f"function a{n:x}(e,t){{return e&&t?e.map(function(r){{return r.id==={n}?t:r}}):[]}}"
+                 f"var b{n:x}=\"chunk-{n:x}\",c{n:x}={{k:{n},v:\"{n:x}{n:o}\"}};")
+        pieces.append(piece)
+        total += len(piece)
+    return "".join(pieces).encode('utf-8')
+
+
+def generate_monorepo(root: Path, config: dict) -> dict:
+    """
+    Write the synthetic tree: apps/ and packages/ with TS/TSX components,
+    pages and helpers, planted secrets in client-side files, nested
+    node_modules (must be pruned), generated bundles in .next/ (pruned) and
+    one in a client-side directory (scanned, large enough to be mmapped).
+    """
+    rng = random.Random(config["seed"])
+    started = time.perf_counter()
+    if root.exists():
+        shutil.rmtree(root)
+    root.mkdir(parents=True)
+    # Marks the directory as ours from the start, so an interrupted run can be regenerated
+    (root / BENCH_MANIFEST).write_text("{}", encoding='utf-8')
+    (root / "pnpm-workspace.yaml").write_text('packages:\n  - "apps/*"\n  - "packages/*"\n', encoding='utf-8')
+    (root / ".gitignore").write_text("node_modules/\n.next/\n.qa_wolf/\n", encoding='utf-8')
+
+    units = [f"apps/app-{i}" for i in range(BENCH_APPS)] + [f"packages/pkg-{i}" for i in range(BENCH_PACKAGES)]
+    client_files: List[Path] = []
+    total_bytes = 0
+    for n in range(config["files"]):
+        unit = units[n % len(units)]
+        feature = (n // len(units)) % BENCH_FEATURES
+        kind = n % 4
+        if kind == 0:
+            path = root / unit / "src" / "lib" / f"feature-{feature}" / f"utils{n}.ts"
+            content = LIB_TEMPLATE.format(n=n, limit=n % 997)
+        elif kind == 1 and unit.startswith("apps/"):
+            path = root / unit / "src" / "app" / f"route-{feature}" / f"r{n}" / "page.tsx"
+            content = PAGE_TEMPLATE.format(n=n, feature=feature)
+        else:
+            path = root / unit / "src" / "components" / f"feature-{feature}" / f"Component{n}.tsx"
+            content = COMPONENT_TEMPLATE.format(n=n, limit=n % 997)
+        if "/components/" in path.as_posix():
+            client_files.append(path)
+        write_file(path, content)
+        total_bytes += len(content)
+
+    # Planted secrets (each one is a line the security scan must report)
+    planted = rng.sample(client_files, min(config["secrets"], len(client_files)))
+    for path in planted:
+        with open(path, "a", encoding='utf-8') as f:
+            f.write(PLANTED_SECRET)
+
+    # Nested node_modules full of "secrets": the walker must never enter them
+    for n in range(config["node_modules_files"]):
+        app = f"apps/app-{n % BENCH_APPS}"
+        depth = 1 + n % 3
+        parts = []
+        for level in range(depth):
+            parts += ["node_modules", f"dep-{(n // BENCH_APPS + level) % 50}"]
+        write_file(root / app / Path(*parts) / f"index{n}.js", f"module.exports = process.env.STRIPE_SECRET_KEY; // {n}\n")
+
+    # Large generated bundles: build output (pruned) and one vendored into client code (scanned)
+    bundle_size = int(config["bundle_mb"] * 1024 * 1024)
+    for n in range(config["bundles"]):
+        path = root / "apps" / f"app-{n % BENCH_APPS}" / ".next" / "static" / "chunks" / f"{n}-{n * 7919:x}.js"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(generated_bundle(bundle_size, n))
+    if config["bundles"]:
+        vendored = root / "apps" / "app-0" / "src" / "components" / "vendor" / "vendor.bundle.js"
+        vendored.parent.mkdir(parents=True, exist_ok=True)
+        vendored.write_bytes(generated_bundle(bundle_size, config["seed"]))
+        total_bytes += bundle_size
+
+    # One Header per app: working routes, per-app routes and broken ones
+    for i in range(BENCH_APPS):
+        hrefs = ["/"] + [f"/page-{k}" for k in range(BENCH_HEADER_LINKS)]
+        hrefs += [f"/app-{i}/page-{k}" for k in range(BENCH_HEADER_LINKS // 3)]
+        hrefs += [f"/broken-{i}-{k}" for k in range(config["broken"])]
+        links = "\n".join(f'        <a href="{href}">Link {k}</a>' for k, href in enumerate(hrefs))
+        write_file(root / "apps" / f"app-{i}" / "src" / "components" / "Header.tsx",
+                   f"export function Header() {{\n  return (\n    <nav>\n{links}\n    </nav>\n  );\n}}\n")
+
+    return {
+        "files": config["files"],
+        "bytes": total_bytes,
+        "planted_secrets": len(planted),
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+def prepare_monorepo(workdir: Path, config: dict) -> dict:
+    """Reuse the tree in `workdir` if it was generated with the same parameters."""
+    manifest = workdir / BENCH_MANIFEST
+    try:
+        previous = json.loads(manifest.read_text(encoding='utf-8'))
+        if previous.get("config") == config and previous.get("version") == BENCH_VERSION:
+            print(f"♻️  Reusing synthetic monorepo in {workdir}", file=sys.stderr)
+            return dict(previous["generation"], reused=True)
+    except (OSError, ValueError):
+        pass
+
+    # Only a tree this script generated (or an empty directory) is ever deleted
+    if workdir.exists() and not manifest.is_file() and (not workdir.is_dir() or any(workdir.iterdir())):
+        print(f"❌ {workdir} exists and wasn't generated by this script (no {BENCH_MANIFEST}); "
+              f"refusing to overwrite it. Pass an empty or new --workdir.", file=sys.stderr)
+        sys.exit(2)
+
+    print(f"🏗️  Generating {config['files']} files in {workdir}...", file=sys.stderr)
+    generation = generate_monorepo(workdir, config)
+    manifest.write_text(json.dumps({"version": BENCH_VERSION, "config": config, "generation": generation}),
+                        encoding='utf-8')
+    return dict(generation, reused=False)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Stub Server
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class StubServer:
+    """
+    Local HTTP/1.1 keep-alive server: every response is delayed by
+    `latency_ms` (± `jitter_ms`), /broken-* paths are 404s, /redirect-*
+    redirect to /, and everything else is a gzip-able HTML page with a CTA.
+    """
+
+    def __init__(self, latency_ms: float, jitter_ms: float):
+        latency, jitter = latency_ms / 1000, jitter_ms / 1000
+        compressed = gzip.compress(STUB_PAGE)
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                stub.requests += 1
+                delay = latency + (random.uniform(-jitter, jitter) if jitter else 0.0)
+                if delay > 0:
+                    time.sleep(delay)
+                if self.path.startswith("/broken"):
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                if self.path.startswith("/redirect"):
+                    self.send_response(301)
+                    self.send_header("Location", "/")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                body = STUB_PAGE
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("ETag", '"stub"')
+                if "gzip" in self.headers.get("Accept-Encoding", ""):
+                    body = compressed
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(body)
+
+            do_HEAD = do_GET
+
+            def log_message(self, *args):
+                pass
+
+        self.requests = 0
+        self.server = ThreadingHTTPServer(("localhost", 0), Handler)
+        self.server.daemon_threads = True
+        self.port = self.server.server_address[1]
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Timing
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def describe(outcome) -> dict:
+    """What a benchmarked call returned, to check runs are doing the same work."""
+    if isinstance(outcome, qa_wolf.CheckResult):
+        return {"status": outcome.status.value, "message": outcome.message, "stats": outcome.stats}
+    if isinstance(outcome, list):
+        return {"items": len(outcome)}
+    return {}
+
+
+def time_benchmark(name: str, run: Callable[[], object], repeat: int, warmup: int,
+                   setup: Optional[Callable[[], None]] = None) -> dict:
+    """Wall and CPU time of `repeat` calls (after `warmup` untimed ones); qa_wolf's own output is muted."""
+    print(f"⏱️  {name}", file=sys.stderr)
+    walls, cpus = [], []
+    outcome = None
+    for index in range(warmup + repeat):
+        if setup is not None:
+            setup()
+        with contextlib.redirect_stdout(io.StringIO()):
+            wall, cpu = time.perf_counter(), time.process_time()
+            outcome = run()
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+        if index >= warmup:
+            walls.append(wall)
+            cpus.append(cpu)
+    return {
+        "runs_s": [round(w, 4) for w in walls],
+        "min_s": round(min(walls), 4),
+        "median_s": round(statistics.median(walls), 4),
+        "mean_s": round(statistics.mean(walls), 4),
+        "stdev_s": round(statistics.stdev(walls), 4) if len(walls) > 1 else 0.0,
+        "cpu_median_s": round(statistics.median(cpus), 4),
+        "result": describe(outcome),
+    }
+
+
+def fresh_walk():
+    """Forget the walker's per-process file list, as every new gate run would."""
+    qa_wolf._source_file_cache.clear()
+
+
+def run_benchmarks(root: Path, server: StubServer, args) -> Dict[str, dict]:
+    results = {}
+    repeat, warmup = args.repeat, args.warmup
+
+    def drop_scan_cache():
+        fresh_walk()
+        shutil.rmtree(root / qa_wolf.QA_WOLF_DIR, ignore_errors=True)
+
+    results["run_security_scan[cold]"] = time_benchmark(
+        "run_security_scan (no cache)", lambda: qa_wolf.run_security_scan(root, use_cache=False, jobs=args.jobs),
+        repeat, warmup, setup=fresh_walk)
+    # Prime the per-file scan cache once, then time unchanged re-runs
+    drop_scan_cache()
+    with contextlib.redirect_stdout(io.StringIO()):
+        qa_wolf.run_security_scan(root, use_cache=True, jobs=args.jobs)
+    results["run_security_scan[cached]"] = time_benchmark(
+        "run_security_scan (warm cache)", lambda: qa_wolf.run_security_scan(root, use_cache=True, jobs=args.jobs),
+        repeat, warmup, setup=fresh_walk)
+    drop_scan_cache()
+
+    results["extract_links_from_header"] = time_benchmark(
+        "extract_links_from_header", lambda: qa_wolf.extract_links_from_header(root),
+        repeat, warmup, setup=fresh_walk)
+
+    before = server.requests
+    results["run_link_audit"] = time_benchmark(
+        "run_link_audit", lambda: qa_wolf.run_link_audit(root, server.port, link_cache=None),
+        repeat, warmup, setup=fresh_walk)
+    results["run_link_audit"]["server_requests"] = server.requests - before
+
+    results["run_visual_qa"] = time_benchmark(
+        "run_visual_qa", lambda: qa_wolf.run_visual_qa(server.port), repeat, warmup)
+    return results
+
+
+def compare(previous: dict, current: dict) -> List[str]:
+    """Median changes per benchmark against an earlier results file."""
+    lines = []
+    old_commit = previous.get("git_commit", "?")[:8]
+    new_commit = current.get("git_commit", "?")[:8]
+    if previous.get("config") != current.get("config"):
+        lines.append("⚠️  Generation parameters differ - numbers are not directly comparable")
+    lines.append(f"{'benchmark':<32} {old_commit:>10} {new_commit:>10}  change")
+    for name, result in current["benchmarks"].items():
+        old = previous.get("benchmarks", {}).get(name)
+        if not old:
+            lines.append(f"{name:<32} {'-':>10} {result['median_s']:>9.3f}s  (new)")
+            continue
+        change = (result["median_s"] - old["median_s"]) / old["median_s"] if old["median_s"] else 0.0
+        flag = ""
+        if change <= -BENCH_COMPARE_NOTE:
+            flag = "  faster"
+        elif change >= BENCH_COMPARE_NOTE:
+            flag = "  SLOWER"
+        lines.append(f"{name:<32} {old['median_s']:>9.3f}s {result['median_s']:>9.3f}s  {change:+.1%}{flag}")
+    return lines
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Main Entry Point
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Release Wolf - Benchmarks",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument("--files", type=int, default=10000, metavar="N", help="TS/TSX files to generate")
+    parser.add_argument("--node-modules-files", type=int, default=None, metavar="N",
+                        help="Files inside nested node_modules (default: files / 2)")
+    parser.add_argument("--secrets", type=int, default=5, metavar="N", help="Secrets planted in client-side files")
+    parser.add_argument("--bundles", type=int, default=4, metavar="N", help="Generated bundles under .next/")
+    parser.add_argument("--bundle-mb", type=float, default=4.0, metavar="MB", help="Size of each generated bundle")
+    parser.add_argument("--broken", type=int, default=5, metavar="N", help="Broken links per Header")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the generated tree")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="Stub server delay per request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Random +/- added to the delay")
+    parser.add_argument("--repeat", type=int, default=5, metavar="N", help="Timed runs per benchmark")
+    parser.add_argument("--warmup", type=int, default=1, metavar="N", help="Untimed runs before timing")
+    parser.add_argument("--jobs", "-j", type=int, default=1, metavar="N", help="Passed to run_security_scan")
+    parser.add_argument("--workdir", type=Path, default=Path(tempfile.gettempdir()) / "qa_wolf_bench",
+                        help="Where the synthetic monorepo lives (reused between runs)")
+    parser.add_argument("--output", "-o", type=Path, help="Write results JSON here instead of stdout")
+    parser.add_argument("--compare", type=Path, metavar="JSON", help="Print changes against an earlier results file")
+    args = parser.parse_args()
+
+    config = {
+        "files": args.files,
+        "node_modules_files": args.node_modules_files if args.node_modules_files is not None else args.files // 2,
+        "secrets": args.secrets,
+        "bundles": args.bundles,
+        "bundle_mb": args.bundle_mb,
+        "broken": args.broken,
+        "seed": args.seed,
+    }
+    root = args.workdir.resolve()
+    generation = prepare_monorepo(root, config)
+
+    with StubServer(args.latency_ms, args.jitter_ms) as server:
+        benchmarks = run_benchmarks(root, server, args)
+
+    commit, dirty = qa_wolf.git_head(Path(__file__).resolve().parent)
+    results = {
+        "version": BENCH_VERSION,
+        "created": time.time(),
+        "git_commit": commit,
+        "dirty": dirty,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "config": dict(config, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                       repeat=args.repeat, warmup=args.warmup, jobs=args.jobs),
+        "generation": generation,
+        "benchmarks": benchmarks,
+    }
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding='utf-8')
+        print(f"📄 Results written to {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+    if args.compare:
+        try:
+            previous = json.loads(args.compare.read_text(encoding='utf-8'))
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Could not read {args.compare}: {e}", file=sys.stderr)
+            sys.exit(1)
+        print("\n".join(compare(previous, results)), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
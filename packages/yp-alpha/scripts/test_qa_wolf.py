@@ -0,0 +1,228 @@
+"""
+Tests for qa_wolf.py: result memo invalidation, module resolution and the
+byte-level security scan. Run with `python -m pytest packages/yp-alpha/scripts`.
+"""
+
+import argparse
+import json
+import re
+import shutil
+from pathlib import Path
+
+import pytest
+
+import qa_wolf
+
+
+def write(path: Path, text: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding='utf-8')
+    return path
+
+
+@pytest.fixture(autouse=True)
+def fresh_walk_cache(monkeypatch):
+    # collect_source_files() shares one walk per root for the whole process
+    monkeypatch.setattr(qa_wolf, "_source_file_cache", {})
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Result memo keys
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def security_checks(root: Path, memo: qa_wolf.ResultMemo) -> dict:
+    args = argparse.Namespace(fail_fast=False, profile=False, app=None, links_only=False, exclude_dir=[],
+                              no_cache=True, security_only=True)
+    return qa_wolf.build_checks(root, [], None, args, jobs=1, memo=memo).checks
+
+
+def memo_keys(root: Path, options: dict = None) -> dict:
+    memo = qa_wolf.ResultMemo(root, options or {})
+    try:
+        return {key: memo.key(check) for key, check in security_checks(root, memo).items()
+                if key in ("security", "entropy")}
+    finally:
+        memo.close()
+
+
+@pytest.fixture
+def monorepo(tmp_path: Path) -> Path:
+    write(tmp_path / "apps/web/src/app/page.tsx", "export default function Page() { return null }\n")
+    write(tmp_path / "apps/web/lib/server.ts", "export const db = process.env.DATABASE_URL\n")
+    write(tmp_path / qa_wolf.ENTROPY_ALLOWLIST_FILE, "# reviewed\n")
+    return tmp_path
+
+
+def test_memo_key_is_stable(monorepo):
+    keys = memo_keys(monorepo)
+    assert all(keys.values())
+    assert memo_keys(monorepo) == keys
+
+
+def test_memo_key_changes_with_client_source(monorepo):
+    before = memo_keys(monorepo)
+    write(monorepo / "apps/web/src/app/page.tsx", "export default function Page() { return 'changed' }\n")
+    after = memo_keys(monorepo)
+    assert after["security"] != before["security"]
+    assert after["entropy"] != before["entropy"]
+
+
+def test_memo_key_ignores_server_source(monorepo):
+    before = memo_keys(monorepo)
+    write(monorepo / "apps/web/lib/server.ts", "export const db = process.env.DATABASE_URL ?? ''\n")
+    assert memo_keys(monorepo) == before
+
+
+def test_memo_key_changes_with_allowlist(monorepo):
+    before = memo_keys(monorepo)
+    write(monorepo / qa_wolf.ENTROPY_ALLOWLIST_FILE, "# reviewed\n0123456789abcdef\n")
+    after = memo_keys(monorepo)
+    assert after["entropy"] != before["entropy"]
+    assert after["security"] == before["security"]
+
+
+def test_memo_key_changes_with_script(monorepo, tmp_path_factory, monkeypatch):
+    before = memo_keys(monorepo)
+    script = tmp_path_factory.mktemp("script") / "qa_wolf.py"
+    shutil.copy(qa_wolf.__file__, script)
+    with open(script, "a", encoding='utf-8') as f:
+        f.write("\n# changed\n")
+    monkeypatch.setattr(qa_wolf, "__file__", str(script))
+    after = memo_keys(monorepo)
+    assert after["security"] != before["security"]
+    assert after["entropy"] != before["entropy"]
+
+
+def test_exclude_dir_leaves_walk_deny_dirs_alone(monorepo):
+    write(monorepo / "apps/web/src/app/legacy/old.tsx", "export const k = process.env.OPENAI_API_KEY\n")
+    deny_dirs = qa_wolf.WALK_DENY_DIRS + ["legacy"]
+    walked = {source.rel_path for source in qa_wolf.collect_source_files(monorepo, deny_dirs=deny_dirs)}
+    assert "apps/web/src/app/page.tsx" in walked
+    assert "apps/web/src/app/legacy/old.tsx" not in walked
+    assert "legacy" not in qa_wolf.WALK_DENY_DIRS
+    assert "apps/web/src/app/legacy/old.tsx" in {source.rel_path for source in qa_wolf.collect_source_files(monorepo)}
+    changed = ["apps/web/src/app/legacy/old.tsx"]
+    assert qa_wolf.collect_source_files(monorepo, changed, deny_dirs) == []
+
+
+def test_memo_key_changes_with_options(monorepo):
+    assert memo_keys(monorepo, {"since": "main"}) != memo_keys(monorepo, {"since": "HEAD~1"})
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Module resolution
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Path:
+    write(tmp_path / "tsconfig.base.json", json.dumps({
+        "compilerOptions": {"paths": {"~lib/*": ["packages/lib/src/*"]}},
+    }))
+    # JSONC: comments and trailing commas, paths inherited through `extends`
+    write(tmp_path / "apps/web/tsconfig.json", """{
+        // shared paths live in the base config
+        "extends": "../../tsconfig.base",
+        "compilerOptions": { "strict": true, },
+    }""")
+    write(tmp_path / "apps/web/src/app/page.tsx", "")
+    write(tmp_path / "apps/web/src/utils/format.ts", "")
+    write(tmp_path / "apps/admin/tsconfig.json", json.dumps({
+        "extends": "../../tsconfig.base.json",
+        "compilerOptions": {"baseUrl": ".", "paths": {"@/*": ["./src/*"], "config": ["./src/config/index.ts"]}},
+    }))
+    write(tmp_path / "apps/admin/src/app/page.tsx", "")
+    write(tmp_path / "apps/admin/src/components/Nav.tsx", "")
+    write(tmp_path / "apps/admin/src/config/index.ts", "")
+
+    write(tmp_path / "packages/lib/package.json", json.dumps({"name": "@acme/lib"}))
+    write(tmp_path / "packages/lib/src/index.ts", "")
+    write(tmp_path / "packages/lib/src/date.ts", "")
+    write(tmp_path / "packages/ui/package.json", json.dumps({
+        "name": "@acme/ui",
+        "exports": {
+            ".": "./dist/index.js",
+            "./button": {"types": "./dist/button.d.ts", "import": "./src/button.tsx"},
+            "./icons/*": "./src/icons/*.tsx",
+        },
+    }))
+    write(tmp_path / "packages/ui/src/index.ts", "")
+    write(tmp_path / "packages/ui/src/button.tsx", "")
+    write(tmp_path / "packages/ui/src/icons/arrow.tsx", "")
+    return tmp_path
+
+
+@pytest.mark.parametrize("spec, importer, expected", [
+    ("./format", "apps/web/src/utils/index.ts", "apps/web/src/utils/format.ts"),
+    ("../utils/format.js", "apps/web/src/app/page.tsx", "apps/web/src/utils/format.ts"),
+    # tsconfig `paths`, own and inherited through `extends`
+    ("~lib/date", "apps/web/src/app/page.tsx", "packages/lib/src/date.ts"),
+    ("@/components/Nav", "apps/admin/src/app/page.tsx", "apps/admin/src/components/Nav.tsx"),
+    ("config", "apps/admin/src/app/page.tsx", "apps/admin/src/config/index.ts"),
+    ("@/components/Nav", "apps/web/src/app/page.tsx", None),
+    # Workspace packages: `exports` (dist/ mapped back to src/), conditions and patterns
+    ("@acme/ui", "apps/web/src/app/page.tsx", "packages/ui/src/index.ts"),
+    ("@acme/ui/button", "apps/web/src/app/page.tsx", "packages/ui/src/button.tsx"),
+    ("@acme/ui/icons/arrow", "apps/web/src/app/page.tsx", "packages/ui/src/icons/arrow.tsx"),
+    ("@acme/lib", "apps/web/src/app/page.tsx", "packages/lib/src/index.ts"),
+    ("react", "apps/web/src/app/page.tsx", None),
+    ("node:fs", "apps/web/src/app/page.tsx", None),
+])
+def test_resolve(workspace, spec, importer, expected):
+    assert qa_wolf.ModuleResolver(workspace).resolve(spec, importer) == expected
+
+
+def test_tsconfig_paths_follow_extends(workspace):
+    base, paths = qa_wolf.tsconfig_paths(workspace / "apps/web/tsconfig.json")
+    assert base.resolve() == workspace.resolve()
+    assert paths == {"~lib/*": ["packages/lib/src/*"]}
+
+    # Own paths replace the inherited ones and are relative to baseUrl
+    base, paths = qa_wolf.tsconfig_paths(workspace / "apps/admin/tsconfig.json")
+    assert base.resolve() == (workspace / "apps/admin").resolve()
+    assert set(paths) == {"@/*", "config"}
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Security scan
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def baseline_scan(data: bytes):
+    """The original scan: decode the file and test it line by line."""
+    try:
+        text = data.decode('utf-8')
+    except UnicodeDecodeError:
+        return []
+    return qa_wolf.scan_text(text, re.compile("|".join(qa_wolf.DANGEROUS_PATTERNS)))
+
+
+SCAN_CASES = [
+    b"",
+    b"const a = 1\n",
+    b"const key = process.env.OPENAI_API_KEY\n",
+    b"const url = DATABASE_URL",  # no trailing newline
+    b"// OPENAI_API_KEY in a comment\n * STRIPE_SECRET_KEY in a doc comment\n",
+    b"type Env = { DATABASE_URL: string }\ninterface Keys { OPENAI_API_KEY: string }\n",
+    b"a\nb\nconst x = STRIPE_SECRET_KEY + DATABASE_URL\nc\nconst y = CONVEX_DEPLOY_KEY\n",
+    b"const a = 1\r\nconst key = ANTHROPIC_API_KEY\r\n",
+    b"const a = 1\rconst key = ANTHROPIC_API_KEY\r",
+    b"one\x0bSUPABASE_SERVICE_KEY\x0cthree\n",
+    "x = ' '\nconst k = SHOPIFY_ADMIN_TOKEN\n".encode('utf-8'),
+    b"\xff\xfe DATABASE_URL\n",  # not UTF-8: skipped
+    ("    const k = process.env.STRIPE_SECRET" + " padding" * 20 + "\n").encode('utf-8'),
+    b"\n" * 5000 + b"const k = OPENAI_API_KEY\n" + b"x\n" * 5000 + b"const d = DATABASE_URL\n",
+]
+
+
+@pytest.mark.parametrize("data", SCAN_CASES)
+def test_scan_buffer_matches_line_scan(data):
+    assert qa_wolf.scan_buffer(data) == baseline_scan(data)
+
+
+def test_scan_path_matches_line_scan_with_mmap(tmp_path, monkeypatch):
+    monkeypatch.setattr(qa_wolf, "MMAP_THRESHOLD", 1)
+    for i, data in enumerate(SCAN_CASES[1:]):
+        path = tmp_path / f"case{i}.ts"
+        path.write_bytes(data)
+        digest, violations = qa_wolf.scan_path(path)
+        assert digest is not None
+        assert violations == baseline_scan(data)